@@ -1,7 +1,13 @@
 """Tkinter-based UI for interactive video cropping."""
 from __future__ import annotations
 
+import atexit
+import concurrent.futures
+import functools
+import os
 import platform
+import queue
+import shutil
 import tempfile
 import threading
 import time
@@ -19,23 +25,29 @@ import vlc
 try:
     from .core import (
         ASPECT_PRESETS,
+        CanvasLayout,
         CropBox,
-        crop_box_from_canvas_drag,
+        VideoInfo,
+        canvas_layout,
+        crop_box_from_layout,
         describe_video,
         full_frame_crop,
         centered_crop_for_ratio,
     )
-    from .ffmpeg_utils import crop_video, extract_frame, probe_video
+    from .ffmpeg_utils import FrameServer, crop_video, extract_frame, probe_video
 except ImportError:
     from video_cropper.core import (
         ASPECT_PRESETS,
+        CanvasLayout,
         CropBox,
-        crop_box_from_canvas_drag,
+        VideoInfo,
+        canvas_layout,
+        crop_box_from_layout,
         describe_video,
         full_frame_crop,
         centered_crop_for_ratio,
     )
-    from video_cropper.ffmpeg_utils import crop_video, extract_frame, probe_video
+    from video_cropper.ffmpeg_utils import FrameServer, crop_video, extract_frame, probe_video
 
 
 class VideoCropperApp:
@@ -43,9 +55,59 @@ class VideoCropperApp:
         self.root = root
         self.root.title("Video Cropper")
         self.video_path: Path | None = None
-        self.metadata = None
+        self.metadata: VideoInfo | None = None
+        # Source video size; crop boxes are always in these coordinates even
+        # though preview frames are decoded at display size.
+        self.frame_size: tuple[int, int] | None = None
+        # Centered crop for each aspect preset, rebuilt when a video loads.
+        self._preset_boxes: dict[str, CropBox] = {}
+        self.fps = 0.0
+        # Persistent ffmpeg pipe for preview frames; rebuilt when the video or
+        # display size changes. Only the decode thread reads frames from it.
+        # The lock guards swapping these two references, never a decode, so
+        # the Tk thread can close the server without waiting on ffmpeg.
+        self.frame_server: FrameServer | None = None
+        self._busy_frame_server: FrameServer | None = None
+        self._frame_server_lock = threading.Lock()
+        # Set while "Save" rewrites the open file: no ffmpeg process may hold
+        # it open then, or Windows refuses to replace it.
+        self._previews_blocked = False
+        # Preview decoding runs on a background thread. The Tk thread posts
+        # the latest wanted frame to _decode_request; finished frames come
+        # back through _frame_queue and are picked up by _pump_frames.
+        self._decode_request: tuple | None = None
+        self._decode_lock = threading.Lock()
+        self._decode_wanted = threading.Event()
+        self._frame_queue: queue.Queue[tuple[float, Image.Image | Exception]] = queue.Queue(maxsize=5)
+        self._decode_target: float | None = None
+        self._pump_job: str | None = None
+        self._frame_tolerance = 0.04
+        threading.Thread(target=self._decode_loop, daemon=True).start()
         self.current_image: Image.Image | None = None
         self.photo_image: ImageTk.PhotoImage | None = None
+        # Canvas item ids, created on the first draw and updated in place.
+        self._img_item: int | None = None
+        self._rect_item: int | None = None
+        self._label_item: int | None = None
+        # Last rectangle coords and label text sent to Tk, to skip no-op updates.
+        self._overlay_state: tuple | None = None
+        # (key, resample filter, photo image, source image) describing what
+        # photo_image currently shows. Holding the source image keeps its id()
+        # in the key from being reused.
+        self._resize_cache: tuple | None = None
+        # Full-quality resizes run on a worker; results from superseded
+        # requests are dropped by comparing generations.
+        self._resize_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._resize_generation = 0
+        self._resize_inflight_key: tuple | None = None
+        # Short background jobs such as ffprobe, kept off the Tk thread.
+        self._bg_pool = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+        # Letterbox geometry of the video frame inside the canvas, recomputed
+        # only on <Configure> and when a new video is loaded.
+        self._canvas_size = (900, 520)  # until the first <Configure>
+        self._layout: CanvasLayout | None = None
+        # What the canvas last showed; _draw_canvas is a no-op while unchanged.
+        self._last_draw_key: tuple | None = None
         self.crop_box = CropBox(0, 0, 0, 0)
         self.drag_start = None
         self.aspect_ratio: float | None = None
@@ -53,8 +115,44 @@ class VideoCropperApp:
         self.timeline_var = tk.DoubleVar(value=0.0)
         self.is_playing = False
         self.playback_job: str | None = None
-        self._playback_step = 0.5
-        self._temp_dir = Path(tempfile.mkdtemp(prefix="video_cropper_"))
+        # Playback is timed with time.monotonic() from (start time, start
+        # position); VLC's coarser clock only re-anchors it on drift.
+        self._play_clock: tuple[float, float] | None = None
+        self._playback_max_fps = 30
+        self._playback_resync = 0.5
+        # Redraws are coalesced into a single pending ``after`` job so bursts
+        # of drag/seek/playback events cost at most one draw per interval.
+        self._redraw_pending: str | None = None
+        self._min_redraw_interval_ms = 100
+        # Drags and freshly decoded frames redraw about once per display
+        # frame instead; events arriving in between are merged.
+        self._fast_redraw_interval_ms = 16
+        # Interactive redraws resample with the cheaper draft filter; the
+        # full-quality LANCZOS pass runs once input has been idle a while.
+        self._draft_filter = Image.Resampling.BILINEAR
+        self._interactive = False
+        self._settle_job: str | None = None
+        self._settle_delay_ms = 200
+        # Timeline scrubs are debounced: only the position the slider settles
+        # on gets decoded.
+        self._pending_seek: float | None = None
+        self._seek_job: str | None = None
+        self._seek_debounce_ms = 50
+        # Oldest log lines are dropped past this many so the Text widget
+        # stays small during long exports.
+        self._log_max_lines = 500
+        # Worker threads must not touch Tk widgets; they post log lines here
+        # and _drain_log_queue writes them from the Tk thread in batches.
+        self._log_queue: queue.Queue[str] = queue.Queue()
+        self._temp_dir = _make_temp_dir()
+        # The scratch dir may live in RAM (/dev/shm), so don't leave it behind.
+        atexit.register(shutil.rmtree, self._temp_dir, ignore_errors=True)
+        # Preview frames are piped from ffmpeg as raw RGB at display size.
+        # VLC snapshots round-trip through a PNG on disk, so they are opt-in.
+        self._use_vlc_snapshot = False
+        # Decoded snapshot files keyed by (path, mtime_ns, size): a paused
+        # player keeps returning the same snapshot, which is decoded once.
+        self._frame_cache = functools.lru_cache(maxsize=4)(_open_rgb_image)
         # Enable normal audio + hardware decoding for smoother playback.
         # Suppress the on-video title overlay and reduce log noise.
         self.vlc_instance = vlc.Instance(
@@ -67,6 +165,7 @@ class VideoCropperApp:
         self.video_panel: tk.Frame | None = None
 
         self._build_ui()
+        self.root.after(100, self._drain_log_queue)
 
     # UI construction -----------------------------------------------------
     def _build_ui(self) -> None:
@@ -109,6 +208,7 @@ class VideoCropperApp:
         self.canvas.bind("<ButtonPress-1>", self._on_press)
         self.canvas.bind("<B1-Motion>", self._on_drag)
         self.canvas.bind("<ButtonRelease-1>", self._on_release)
+        self.canvas.bind("<Configure>", self._on_canvas_resize)
 
         controls = ttk.Frame(left_panel)
         controls.pack(fill=tk.X, pady=(8, 0))
@@ -159,27 +259,25 @@ class VideoCropperApp:
         )
         if not file_path:
             return
-        self.video_path = Path(file_path)
-        try:
-            self.metadata = probe_video(self.video_path)
-            self._load_media_player()
-            self._update_info()
-            self._load_preview_frame()
-        except Exception as exc:  # noqa: BLE001
-            messagebox.showerror("Error", str(exc))
-            self._log(str(exc))
+        self._open_video(Path(file_path))
 
     def _apply_preset(self, _event=None) -> None:
         preset_name = self.aspect_select.get()
         self.aspect_ratio = ASPECT_PRESETS.get(preset_name)
-        if self.current_image and self.aspect_ratio:
-            self._set_box_from_ratio(self.aspect_ratio)
-            self._draw_canvas()
+        box = self._preset_boxes.get(preset_name)
+        if self.current_image and box is not None:
+            self.crop_box = box
+            self._sync_vars()
+            self._request_redraw()
 
     def _on_press(self, event):
         if not self.current_image:
             return
         self.drag_start = (event.x, event.y)
+        self._interactive = True
+        if self._settle_job:
+            self.root.after_cancel(self._settle_job)
+            self._settle_job = None
 
     def _on_drag(self, event):
         if not self.drag_start or not self.current_image:
@@ -189,19 +287,42 @@ class VideoCropperApp:
         x0, y0 = min(start_x, end_x), min(start_y, end_y)
         x1, y1 = max(start_x, end_x), max(start_y, end_y)
         self._update_crop_from_canvas(x0, y0, x1, y1)
-        self._draw_canvas()
+        self._request_redraw(self._fast_redraw_interval_ms)
+
+    def _on_canvas_resize(self, event) -> None:
+        self._canvas_size = (event.width, event.height)
+        self._compute_layout()
+        self._last_draw_key = None
+        if self.current_image:
+            self._request_redraw()
+        if self.frame_size and not self.is_playing:
+            # Frames are decoded at display size, so fetch one at the new size
+            # once resizing settles instead of upscaling the old one.
+            self._schedule_seek(self.timeline_var.get())
 
     def _on_release(self, _event):
+        if self.drag_start is None:
+            return
         self.drag_start = None
+        self._sync_vars()
+        self._settle_job = self.root.after(self._settle_delay_ms, self._settle)
+
+    def _settle(self) -> None:
+        """Replace the draft-quality preview with a full-quality one."""
+        self._settle_job = None
+        self._interactive = False
+        self._request_redraw()
 
     # Core logic ----------------------------------------------------------
     def _load_preview_frame(self) -> None:
-        assert self.video_path
+        if self.video_path is None:
+            return
         self._load_frame_at(0.0, reset_crop=True)
 
     def _reset_crop_to_full_frame(self) -> None:
-        assert self.current_image
-        width, height = self.current_image.size
+        if self.frame_size is None:
+            return
+        width, height = self.frame_size
         self.crop_box = full_frame_crop(width, height)
         self._sync_vars()
 
@@ -210,60 +331,176 @@ class VideoCropperApp:
             return
         msg, duration = describe_video(self.video_path, self.metadata)
         self.duration = duration
-        width = self.metadata["streams"][0]["width"]
-        height = self.metadata["streams"][0]["height"]
-        msg = f"Loaded: {self.video_path.name}\n{width}x{height} • {duration:.2f}s"
+        width, height = self.frame_size = (self.metadata.width, self.metadata.height)
+        self._preset_boxes = {
+            name: centered_crop_for_ratio(width, height, ratio)
+            for name, ratio in ASPECT_PRESETS.items()
+            if ratio is not None
+        }
+        self.fps = self.metadata.fps
+        self._compute_layout()
         self.info_label.config(text=msg)
         self.timeline.configure(to=max(duration, 0.01))
         self.timeline_var.set(0.0)
         self._update_time_label(0.0)
 
+    def _request_redraw(self, delay_ms: int | None = None) -> None:
+        """Schedule a canvas redraw, merging requests made before it runs."""
+        if self._redraw_pending is None:
+            if delay_ms is None:
+                delay_ms = self._min_redraw_interval_ms
+            self._redraw_pending = self.root.after(delay_ms, self._do_redraw)
+
+    def _do_redraw(self) -> None:
+        self._redraw_pending = None
+        self._draw_canvas()
+
+    def _compute_layout(self) -> None:
+        if self.frame_size:
+            self._layout = canvas_layout(*self.frame_size, *self._canvas_size)
+
+    def _set_current_image(self, image: Image.Image) -> None:
+        self.current_image = image
+        self._last_draw_key = None
+
     def _draw_canvas(self) -> None:
-        if not self.current_image:
+        layout = self._layout
+        img = self.current_image
+        if img is None or layout is None:
             return
-        canvas_width = self.canvas.winfo_width() or 900
-        canvas_height = self.canvas.winfo_height() or 520
-        image_ratio = self.current_image.width / self.current_image.height
-        canvas_ratio = canvas_width / canvas_height
-        if image_ratio > canvas_ratio:
-            display_width = canvas_width
-            display_height = int(canvas_width / image_ratio)
+        # The interactive flag is part of the key so settling still upgrades
+        # the draft-quality preview.
+        draw_key = (
+            id(img),
+            self.crop_box.as_tuple(),
+            self._canvas_size,
+            self._interactive,
+        )
+        if draw_key == self._last_draw_key:
+            return
+        self._last_draw_key = draw_key
+        image_x, image_y = layout.offset_x, layout.offset_y
+        image_size = (layout.display_width, layout.display_height)
+        if img.size != image_size:
+            # Stale size after a canvas resize, or the cropped preview: fit it
+            # inside the frame area.
+            fit = canvas_layout(*img.size, *image_size)
+            image_x += fit.offset_x
+            image_y += fit.offset_y
+            image_size = (fit.display_width, fit.display_height)
+        self._update_photo_image(*image_size)
+
+        if self._img_item is None:
+            self._img_item = self.canvas.create_image(image_x, image_y, anchor=tk.NW, image=self.photo_image)
+            self._rect_item = self.canvas.create_rectangle(0, 0, 0, 0, outline="#00e5ff", width=3)
+            self._label_item = self.canvas.create_text(0, 0, anchor=tk.W, fill="white")
         else:
-            display_height = canvas_height
-            display_width = int(canvas_height * image_ratio)
-        resized = self.current_image.resize((display_width, display_height), Image.Resampling.LANCZOS)
-        self.photo_image = ImageTk.PhotoImage(resized)
-        self.canvas.delete("all")
-        offset_x = (canvas_width - display_width) // 2
-        offset_y = (canvas_height - display_height) // 2
-        self.canvas.create_image(offset_x, offset_y, anchor=tk.NW, image=self.photo_image)
-
-        scale_x = display_width / self.current_image.width
-        scale_y = display_height / self.current_image.height
-        x0 = offset_x + int(self.crop_box.x * scale_x)
-        y0 = offset_y + int(self.crop_box.y * scale_y)
-        x1 = offset_x + int((self.crop_box.x + self.crop_box.width) * scale_x)
-        y1 = offset_y + int((self.crop_box.y + self.crop_box.height) * scale_y)
-
-        self.canvas.create_rectangle(x0, y0, x1, y1, outline="#00e5ff", width=3)
-        self.canvas.create_text(x0 + 8, y0 + 12, anchor=tk.W, text=f"{self.crop_box.width}x{self.crop_box.height}", fill="white")
+            self.canvas.coords(self._img_item, image_x, image_y)
+        self._update_overlay()
 
-    def _update_crop_from_canvas(self, x0: int, y0: int, x1: int, y1: int) -> None:
-        assert self.current_image
-        canvas_width = self.canvas.winfo_width() or 900
-        canvas_height = self.canvas.winfo_height() or 520
-        self.crop_box = crop_box_from_canvas_drag(
-            self.current_image.width,
-            self.current_image.height,
-            canvas_width,
-            canvas_height,
-            x0,
-            y0,
-            x1,
-            y1,
-            self.aspect_ratio,
+    def _update_overlay(self) -> None:
+        """Move the crop rectangle and its size label to match ``crop_box``."""
+        layout = self._layout
+        if self._rect_item is None or layout is None:
+            return
+        box = self.crop_box
+        scale_x, scale_y = layout.scale_img_to_disp
+        x0 = layout.offset_x + int(box.x * scale_x)
+        y0 = layout.offset_y + int(box.y * scale_y)
+        x1 = layout.offset_x + int((box.x + box.width) * scale_x)
+        y1 = layout.offset_y + int((box.y + box.height) * scale_y)
+        text = f"{box.width}x{box.height}"
+        state = (x0, y0, x1, y1, text)
+        if state == self._overlay_state:
+            return
+        if self._overlay_state is None or self._overlay_state[4] != text:
+            self.canvas.itemconfig(self._label_item, text=text)
+        self._overlay_state = state
+        self.canvas.coords(self._rect_item, x0, y0, x1, y1)
+        self.canvas.coords(self._label_item, x0 + 8, y0 + 12)
+
+    def _update_photo_image(self, display_width: int, display_height: int) -> None:
+        """Resize the current frame for display, reusing the cached result when possible.
+
+        While interacting, any cached size match is reused and misses are
+        resized inline with the draft filter. Otherwise the LANCZOS resize is
+        handed to the worker pool and installed by :meth:`_install_photo`
+        when it finishes.
+        """
+        img = self.current_image
+        if img is None:
+            return
+        key = (id(img), display_width, display_height)
+        interactive = self._interactive
+        if self._resize_cache is not None and self._resize_cache[0] == key:
+            if interactive or self._resize_cache[1] == Image.Resampling.LANCZOS:
+                # Already on screen: the cache entry always holds photo_image.
+                return
+        if not interactive and self._resize_inflight_key == key:
+            return
+        self._resize_generation += 1
+        if img.size == (display_width, display_height):
+            # Frames are normally decoded at display size already.
+            self._resize_inflight_key = None
+            self._show_photo(img, key, Image.Resampling.LANCZOS, img)
+            return
+        if interactive:
+            self._resize_inflight_key = None
+            resized = _fit_image(img, (display_width, display_height), self._draft_filter)
+            self._show_photo(resized, key, self._draft_filter, img)
+            return
+
+        generation = self._resize_generation
+        self._resize_inflight_key = key
+        future = self._resize_pool.submit(_fit_image, img, (display_width, display_height), Image.Resampling.LANCZOS)
+        future.add_done_callback(
+            lambda fut: self.root.after(0, self._install_photo, generation, key, img, fut)
         )
-        self._sync_vars()
+
+    def _install_photo(
+        self,
+        generation: int,
+        key: tuple,
+        source: Image.Image,
+        future: concurrent.futures.Future,
+    ) -> None:
+        """Show a finished background resize unless a newer one was requested."""
+        if generation != self._resize_generation:
+            return
+        self._resize_inflight_key = None
+        try:
+            resized = future.result()
+        except Exception as exc:  # noqa: BLE001
+            self._log(f"Preview resize failed: {exc}")
+            return
+        self._show_photo(resized, key, Image.Resampling.LANCZOS, source)
+
+    def _show_photo(self, resized: Image.Image, key: tuple, resample: int, source: Image.Image) -> None:
+        """Put ``resized`` on the canvas, reusing the PhotoImage when possible.
+
+        A same-sized PhotoImage is updated in place with ``paste`` so no new
+        Tk image is allocated per frame. Otherwise the canvas item is pointed
+        at the new one first; the old one's last references (``_resize_cache``
+        and a local here) are gone once this returns, so its Tk image is
+        deleted right away instead of lingering until garbage collection.
+        """
+        photo = self.photo_image
+        if photo is not None and (photo.width(), photo.height()) == resized.size:
+            photo.paste(resized)
+        else:
+            self.photo_image = ImageTk.PhotoImage(resized)
+            if self._img_item is not None:
+                self.canvas.itemconfig(self._img_item, image=self.photo_image)
+        self._resize_cache = (key, resample, self.photo_image, source)
+
+    def _update_crop_from_canvas(self, x0: int, y0: int, x1: int, y1: int) -> None:
+        if self._layout is None:
+            return
+        self.crop_box = crop_box_from_layout(self._layout, x0, y0, x1, y1, self.aspect_ratio)
+        # The canvas label shows the size live; the entries catch up on
+        # release instead of taking four Tk variable writes per motion event.
+        if self.drag_start is None:
+            self._sync_vars()
 
     def _sync_vars(self) -> None:
         self.x_var.set(self.crop_box.x)
@@ -271,43 +508,26 @@ class VideoCropperApp:
         self.w_var.set(self.crop_box.width)
         self.h_var.set(self.crop_box.height)
 
-    def _set_box_from_ratio(self, ratio: float) -> None:
-        assert self.current_image
-        w, h = self.current_image.size
-        self.crop_box = centered_crop_for_ratio(w, h, ratio)
-        self._sync_vars()
-
     def _preview_crop(self) -> None:
-        if not self.video_path:
+        if not self.video_path or self.metadata is None:
             messagebox.showinfo("Select a video", "Please open a video before previewing.")
             return
-        preview_out = self._temp_dir / "preview_cropped.png"
         try:
             self._log("Generating preview frame…")
             self.root.config(cursor="watch")
             self.root.update_idletasks()
-            from_box = self.crop_box.as_tuple()
-            x, y, w, h = from_box
-            args = [
-                "ffmpeg",
-                "-y",
-                "-ss",
-                "1",
-                "-i",
-                str(self.video_path),
-                "-filter:v",
-                f"crop={w}:{h}:{x}:{y}",
-                "-vframes",
-                "1",
-                str(preview_out),
-            ]
-            import subprocess
-
-            proc = subprocess.run(args, capture_output=True, text=True)
-            if proc.returncode != 0:
-                raise RuntimeError(proc.stderr)
-            img = Image.open(preview_out).convert("RGB")
-            self.current_image = img
+            x, y, w, h = self.crop_box.as_tuple()
+            out_w, out_h, buf = extract_frame(
+                self.video_path,
+                1.0,
+                w,
+                h,
+                video_filter=f"crop={w}:{h}:{x}:{y}",
+                keyframe_only=True,
+                max_size=self._canvas_size,
+            )
+            img = Image.frombuffer("RGB", (out_w, out_h), buf, "raw", "RGB", 0, 1)
+            self._set_current_image(img)
             self._draw_canvas()
             self._log("Preview updated using cropped frame.")
         except Exception as exc:  # noqa: BLE001
@@ -317,7 +537,7 @@ class VideoCropperApp:
             self.root.config(cursor="")
 
     def _save_as_video(self) -> None:
-        if not self.video_path:
+        if not self.video_path or self.metadata is None:
             messagebox.showinfo("Select a video", "Please open a video before exporting.")
             return
         save_path = filedialog.asksaveasfilename(
@@ -337,7 +557,7 @@ class VideoCropperApp:
         thread.start()
 
     def _save_overwrite(self) -> None:
-        if not self.video_path:
+        if not self.video_path or self.metadata is None:
             messagebox.showinfo("Select a video", "Please open a video before exporting.")
             return
 
@@ -353,6 +573,7 @@ class VideoCropperApp:
             except Exception:  # noqa: BLE001
                 pass
             self.media_player = None
+        self._block_previews(True)
 
         try:
             with tempfile.NamedTemporaryFile(
@@ -360,6 +581,7 @@ class VideoCropperApp:
             ) as tmp:
                 temp_output = Path(tmp.name)
         except Exception as exc:  # noqa: BLE001
+            self._block_previews(False)
             messagebox.showerror("Error", f"Unable to create a temporary file: {exc}")
             return
 
@@ -373,21 +595,56 @@ class VideoCropperApp:
         thread.start()
 
     def _finalize_overwrite(self, temp_output: Path) -> Path:
-        assert self.video_path
+        if self.video_path is None:
+            raise RuntimeError("No video is loaded to overwrite.")
+        # Previews are blocked, but make sure no frame server survived.
+        self._close_frame_server()
         try:
-            if self.video_path.exists():
-                self.video_path.unlink()
-            temp_output.rename(self.video_path)
+            # Atomic on both POSIX and Windows; the original is never missing.
+            os.replace(temp_output, self.video_path)
         except Exception as exc:  # noqa: BLE001
             raise RuntimeError(f"Failed to replace file: {exc}")
         return self.video_path
 
     def _reload_after_export(self, path: Path) -> None:
         """Reload the just-exported file back into the player."""
+        self._block_previews(False)
+        self._open_video(path)
+
+    def _open_video(self, path: Path) -> None:
+        """Load ``path``, probing it in the background while VLC opens it."""
+        if self.is_playing:
+            self._stop_playback(reload_frame=False)
         self.video_path = path
+        # Everything derived from the previous file stays cleared until the
+        # probe succeeds, so scrubs and exports can't mix the two files.
+        self.metadata = None
+        self.frame_size = None
+        self._layout = None
+        self._preset_boxes = {}
+        self.crop_box = CropBox(0, 0, 0, 0)
+        self.duration = 0.0
+        self._decode_target = None
+        with self._decode_lock:
+            # A request still queued for the old file must not respawn a
+            # frame server on it after the close below.
+            self._decode_request = None
+        self._frame_cache.cache_clear()
+        self._close_frame_server()
+        future = self._bg_pool.submit(probe_video, path)
         try:
-            self.metadata = probe_video(self.video_path)
             self._load_media_player()
+        except Exception as exc:  # noqa: BLE001
+            messagebox.showerror("Error", str(exc))
+            self._log(str(exc))
+        future.add_done_callback(lambda fut: self.root.after(0, self._apply_metadata, path, fut))
+
+    def _apply_metadata(self, path: Path, future: concurrent.futures.Future) -> None:
+        if path != self.video_path:
+            # Another file was opened while this one was being probed.
+            return
+        try:
+            self.metadata = future.result()
             self._update_info()
             self._load_preview_frame()
         except Exception as exc:  # noqa: BLE001
@@ -396,34 +653,158 @@ class VideoCropperApp:
 
     def _run_export(self, output: Path, *, finalize: Callable[[Path], Path] | None = None) -> None:
         try:
-            crop_video(self.video_path, output, self.crop_box.as_tuple(), progress_callback=self._log)
+            crop_video(
+                self.video_path,
+                output,
+                self.crop_box.as_tuple(),
+                progress_callback=self._log_queue.put,
+            )
             final_path = finalize(output) if finalize else output
-            self._log("Export complete!")
-            # Schedule UI update on the Tk main thread: reopen the file.
+            self._log_queue.put("Export complete!")
+            # Schedule UI updates on the Tk main thread: reopen the file.
             self.root.after(0, lambda: self._reload_after_export(final_path))
-            messagebox.showinfo("Done", f"Saved cropped video to {final_path}")
+            self.root.after(0, lambda: messagebox.showinfo("Done", f"Saved cropped video to {final_path}"))
         except Exception as exc:  # noqa: BLE001
             if output.exists():
                 output.unlink(missing_ok=True)
-            self._log(str(exc))
-            messagebox.showerror("Error", str(exc))
+            message = str(exc)
+            self._log_queue.put(message)
+            if finalize:
+                self.root.after(0, self._block_previews, False)
+            self.root.after(0, lambda: messagebox.showerror("Error", message))
+
+    def _drain_log_queue(self) -> None:
+        lines = []
+        try:
+            while True:
+                lines.append(self._log_queue.get_nowait())
+        except queue.Empty:
+            pass
+        if lines:
+            self._log("\n".join(lines))
+        self.root.after(100, self._drain_log_queue)
 
     def _log(self, text: str) -> None:
         self.log_box.configure(state=tk.NORMAL)
         self.log_box.insert(tk.END, text + "\n")
+        # 'end-1c' sits on the empty line after the trailing newline.
+        line_count = int(self.log_box.index("end-1c").split(".")[0]) - 1
+        overflow = line_count - self._log_max_lines
+        if overflow > 0:
+            self.log_box.delete("1.0", f"{overflow + 1}.0")
         self.log_box.configure(state=tk.DISABLED)
         self.log_box.see(tk.END)
 
     def _load_frame_at(self, timestamp: float, *, reset_crop: bool = False) -> None:
-        if not self.video_path:
+        if not self.video_path or not self._layout or self._previews_blocked:
             return
-        preview_path = self._temp_dir / "preview.png"
-        if not self._capture_vlc_snapshot(preview_path, timestamp=timestamp):
-            extract_frame(self.video_path, preview_path, timestamp=timestamp)
-            self.current_image = Image.open(preview_path).convert("RGB")
         if reset_crop or self.crop_box.width == 0:
             self._reset_crop_to_full_frame()
-        self._draw_canvas()
+        width, height = self._layout.display_width, self._layout.display_height
+        if self._use_vlc_snapshot:
+            image = self._capture_vlc_snapshot(self._temp_dir / "preview.png", width, height)
+            if image is not None:
+                self._set_current_image(image)
+                self._request_redraw()
+                return
+        with self._decode_lock:
+            self._decode_request = (self.video_path, width, height, self.fps, timestamp)
+        self._decode_wanted.set()
+        self._decode_target = timestamp
+        if self._pump_job is None:
+            self._pump_job = self.root.after(16, self._pump_frames)
+
+    def _decode_loop(self) -> None:
+        """Background thread: decode the most recently requested frame."""
+        while True:
+            self._decode_wanted.wait()
+            self._decode_wanted.clear()
+            with self._decode_lock:
+                request, self._decode_request = self._decode_request, None
+            if request is None:
+                continue
+            video_path, width, height, fps, timestamp = request
+            server = self._checkout_frame_server(video_path, width, height, fps)
+            if server is None:
+                continue
+            try:
+                buf = server.get_frame(timestamp)
+                result: Image.Image | Exception = Image.frombuffer("RGB", (width, height), buf, "raw", "RGB", 0, 1)
+            except Exception as exc:  # noqa: BLE001
+                result = exc
+            if not self._checkin_frame_server(server):
+                # Closed from the Tk thread mid-decode; the result is stale.
+                continue
+            try:
+                self._frame_queue.put_nowait((timestamp, result))
+            except queue.Full:
+                # The Tk side has fallen behind; make room by dropping the oldest.
+                try:
+                    self._frame_queue.get_nowait()
+                except queue.Empty:
+                    pass
+                self._frame_queue.put_nowait((timestamp, result))
+
+    def _checkout_frame_server(
+        self,
+        video_path: Path,
+        width: int,
+        height: int,
+        fps: float,
+    ) -> FrameServer | None:
+        """Decode thread: return the frame server for a request, or ``None`` while blocked."""
+        with self._frame_server_lock:
+            if self._previews_blocked:
+                return None
+            server = stale = self.frame_server
+            if (
+                server is None
+                or server.video_path != video_path
+                or (server.width, server.height) != (width, height)
+            ):
+                server = self.frame_server = FrameServer(video_path, width, height, fps)
+            else:
+                stale = None
+            self._busy_frame_server = server
+        if stale is not None:
+            stale.close()
+        return server
+
+    def _checkin_frame_server(self, server: FrameServer) -> bool:
+        """Decode thread: finish with ``server``; ``False`` if it was closed meanwhile."""
+        with self._frame_server_lock:
+            self._busy_frame_server = None
+            if server is self.frame_server:
+                return True
+        server.close()
+        return False
+
+    def _pump_frames(self) -> None:
+        """Install the decoded frame matching the latest request, if ready."""
+        self._pump_job = None
+        target = self._decode_target
+        if target is None:
+            return
+        match = None
+        while True:
+            try:
+                timestamp, result = self._frame_queue.get_nowait()
+            except queue.Empty:
+                break
+            # Frames for superseded requests are dropped. During playback the
+            # newest frame is shown even if the clock has moved past it.
+            if self.is_playing or abs(timestamp - target) <= self._frame_tolerance:
+                match = result
+        if match is None:
+            self._pump_job = self.root.after(16, self._pump_frames)
+            return
+        self._decode_target = None
+        if isinstance(match, Exception):
+            self._log(str(match))
+            return
+        self._set_current_image(match)
+        # The seek was already debounced; don't hold the frame back further.
+        self._request_redraw(self._fast_redraw_interval_ms)
 
     def _update_time_label(self, current: float) -> None:
         self.time_label.config(text=f"{current:.1f}s / {self.duration:.1f}s")
@@ -433,9 +814,27 @@ class VideoCropperApp:
             return
         timestamp = float(value)
         self._update_time_label(timestamp)
+        if self.media_player:
+            # Keep the VLC surface in step with the timeline right away.
+            self.media_player.set_time(int(timestamp * 1000))
         if self.is_playing:
-            if self.media_player:
-                self.media_player.set_time(int(timestamp * 1000))
+            # Re-anchor the playback clock; the next tick loads this frame.
+            self._play_clock = (time.monotonic(), timestamp)
+            return
+        self._schedule_seek(timestamp)
+
+    def _schedule_seek(self, timestamp: float) -> None:
+        """Load the frame at ``timestamp`` once no newer request arrives for a moment."""
+        self._pending_seek = timestamp
+        if self._seek_job:
+            self.root.after_cancel(self._seek_job)
+        self._seek_job = self.root.after(self._seek_debounce_ms, self._apply_pending_seek)
+
+    def _apply_pending_seek(self) -> None:
+        self._seek_job = None
+        timestamp, self._pending_seek = self._pending_seek, None
+        if timestamp is None:
+            return
         self._load_frame_at(timestamp)
 
     def _toggle_playback(self) -> None:
@@ -445,47 +844,59 @@ class VideoCropperApp:
         if self.is_playing:
             self._stop_playback()
         else:
+            start = self.timeline_var.get()
             if self.media_player:
-                self.media_player.set_time(int(self.timeline_var.get() * 1000))
+                self.media_player.set_time(int(start * 1000))
                 self.media_player.play()
+            self._play_clock = (time.monotonic(), start)
             self.is_playing = True
             self.play_button.config(text="Pause")
             self._poll_playback()
 
-    def _stop_playback(self) -> None:
+    def _stop_playback(self, *, reload_frame: bool = True) -> None:
         self.is_playing = False
+        self._play_clock = None
         self.play_button.config(text="Play")
         if self.media_player:
             self.media_player.pause()
         if self.playback_job:
             self.root.after_cancel(self.playback_job)
             self.playback_job = None
+        if reload_frame:
+            self._load_frame_at(self.timeline_var.get())
 
     def _poll_playback(self) -> None:
-        if not self.is_playing or not self.media_player:
-            return
-
-        current_ms = self.media_player.get_time()
-        if current_ms >= 0:
-            current = current_ms / 1000
-            self.timeline_var.set(current)
-            self._update_time_label(current)
-            self._capture_vlc_snapshot(self._temp_dir / "preview.png")
-            if self.current_image:
-                self._draw_canvas()
-
-            if current >= self.duration - 0.05:
-                self._stop_playback()
-                self.timeline_var.set(self.duration)
-                self._update_time_label(self.duration)
-                return
+        if not self.is_playing or not self.media_player or self._play_clock is None:
+            return
+
+        started_at, origin = self._play_clock
+        now = time.monotonic()
+        current = origin + now - started_at
+        vlc_ms = self.media_player.get_time()
+        if vlc_ms >= 0 and abs(vlc_ms / 1000 - current) > self._playback_resync:
+            # VLC stalled or jumped (buffering, a seek); follow its clock.
+            current = vlc_ms / 1000
+            self._play_clock = (now, current)
+        self.timeline_var.set(current)
+        self._update_time_label(current)
+        # The canvas covers the VLC surface, so playback is shown by decoding
+        # the current frame into it. The decode thread reads forward from its
+        # ffmpeg pipe and only ever works on the latest tick's request.
+        self._load_frame_at(current)
+
+        if current >= self.duration - 0.05:
+            self._stop_playback()
+            self.timeline_var.set(self.duration)
+            self._update_time_label(self.duration)
+            return
 
         state = self.media_player.get_state()
         if state in (vlc.State.Ended, vlc.State.Error):
             self._stop_playback()
             return
 
-        self.playback_job = self.root.after(int(self._playback_step * 1000), self._poll_playback)
+        fps = min(self.fps or self._playback_max_fps, self._playback_max_fps)
+        self.playback_job = self.root.after(max(1, int(1000 / fps)), self._poll_playback)
 
     def _set_media_player_window(self) -> None:
         """Attach VLC video output to an in-app widget instead of a new window."""
@@ -518,24 +929,100 @@ class VideoCropperApp:
         self._set_media_player_window()
         media = self.vlc_instance.media_new(str(self.video_path))
         self.media_player.set_media(media)
-        self.media_player.play()
-        time.sleep(0.1)
-        self.media_player.pause()
+        # Start playback so VLC renders the first frame, then pause as soon as
+        # it reports playing. A timer covers files that never emit the event.
+        player = self.media_player
+        events = player.event_manager()
+
+        def _on_playing(_event) -> None:
+            # Called on a VLC thread; hand the pause back to Tk.
+            self.root.after(0, self._pause_after_load, player)
 
-    def _capture_vlc_snapshot(self, output_path: Path, *, timestamp: float | None = None) -> bool:
+        events.event_attach(vlc.EventType.MediaPlayerPlaying, _on_playing)
+        player.play()
+        self.root.after(200, self._pause_after_load, player)
+
+    def _pause_after_load(self, player: vlc.MediaPlayer) -> None:
+        # The player may have been replaced or released in the meantime.
+        if player is not self.media_player:
+            return
+        try:
+            player.event_manager().event_detach(vlc.EventType.MediaPlayerPlaying)
+        except Exception:  # noqa: BLE001
+            pass
+        # Leave playback alone if the user already hit Play.
+        if not self.is_playing:
+            player.set_pause(1)
+
+    def _block_previews(self, blocked: bool) -> None:
+        """Stop or resume preview decoding; blocking also closes the frame server."""
+        self._decode_target = None
+        with self._frame_server_lock:
+            self._previews_blocked = blocked
+        if blocked:
+            self._close_frame_server()
+
+    def _close_frame_server(self) -> None:
+        """Close the frame server without waiting for a decode in progress."""
+        with self._frame_server_lock:
+            server, self.frame_server = self.frame_server, None
+            busy = server is not None and server is self._busy_frame_server
+        if server is None:
+            return
+        if busy:
+            # The decode thread finishes closing it once get_frame returns.
+            server.interrupt()
+        else:
+            server.close()
+
+    def _capture_vlc_snapshot(self, output_path: Path, width: int, height: int) -> Image.Image | None:
+        """Snapshot VLC's current frame through a PNG file, or ``None`` on failure."""
         if not self.media_player:
-            return False
+            return None
         try:
-            if timestamp is not None:
-                self.media_player.set_time(int(timestamp * 1000))
-                self.media_player.pause()
+            if not self.is_playing:
+                # Give VLC a moment to render the frame it was just seeked to.
                 time.sleep(0.05)
-            if self.media_player.video_take_snapshot(0, str(output_path), 0, 0) == 0:
-                self.current_image = Image.open(output_path).convert("RGB")
-                return True
-        except Exception:
-            return False
-        return False
+            if self.media_player.video_take_snapshot(0, str(output_path), width, height) == 0:
+                stat = os.stat(output_path)
+                return self._frame_cache(str(output_path), stat.st_mtime_ns, stat.st_size)
+        except Exception:  # noqa: BLE001
+            return None
+        return None
+
+
+def _make_temp_dir() -> Path:
+    """Create the scratch directory, preferring RAM-backed /dev/shm on Linux."""
+    shm = Path("/dev/shm")
+    if shm.is_dir() and os.access(shm, os.W_OK):
+        try:
+            return Path(tempfile.mkdtemp(prefix="video_cropper_", dir=shm))
+        except OSError:
+            pass
+    return Path(tempfile.mkdtemp(prefix="video_cropper_"))
+
+
+def _fit_image(image: Image.Image, size: tuple[int, int], resample: int) -> Image.Image:
+    """Resize ``image`` to ``size``, box-reducing first on large downscales.
+
+    ``Image.reduce`` is a cheap integer box filter, so the final resample
+    only has to cover the remaining (< 2x) gap.
+    """
+    factor = min(image.width // size[0], image.height // size[1])
+    if factor >= 2:
+        image = image.reduce(factor)
+    return image.resize(size, resample)
+
+
+def _open_rgb_image(path: str, _mtime_ns: int, _size: int) -> Image.Image:
+    """Decode an image file as RGB; the unused arguments only key the cache."""
+    image = Image.open(path)
+    if image.mode != "RGB":
+        return image.convert("RGB")
+    # convert() used to force the decode; do it here so the cached image
+    # does not hold the snapshot file open.
+    image.load()
+    return image
 
 
 def run() -> None:
@@ -11,8 +11,9 @@ It intentionally has no dependencies on Tkinter, VLC, or other UI layers.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Mapping, Tuple
+from typing import NamedTuple, Tuple
 
 
 ASPECT_PRESETS: dict[str, float | None] = {
@@ -25,6 +26,19 @@ ASPECT_PRESETS: dict[str, float | None] = {
 }
 
 
+class VideoInfo(NamedTuple):
+    """Probed properties of a video's first video stream."""
+
+    width: int
+    height: int
+    duration: float
+    fps: float
+    codec: str | None = None
+    # Size before the stream's own cropping (e.g. 1088 rows for 1080p H.264).
+    coded_width: int | None = None
+    coded_height: int | None = None
+
+
 @dataclass
 class CropBox:
     """Represents a crop region in pixel coordinates."""
@@ -38,6 +52,27 @@ class CropBox:
         return self.x, self.y, self.width, self.height
 
 
+@dataclass(frozen=True, slots=True)
+class CanvasLayout:
+    """How an image is letterboxed inside a canvas.
+
+    Computed once per image/canvas geometry so per-event handlers only read
+    attributes instead of redoing the fit math.
+    """
+
+    image_width: int
+    image_height: int
+    display_width: int
+    display_height: int
+    offset_x: int
+    offset_y: int
+    # (x, y) multipliers from display pixels to image pixels and back.
+    scale_disp_to_img: Tuple[float, float]
+    scale_img_to_disp: Tuple[float, float]
+    # Display area as (left, top, right, bottom) canvas coordinates.
+    bounds: Tuple[int, int, int, int]
+
+
 def full_frame_crop(image_width: int, image_height: int) -> CropBox:
     """Return a crop box that covers the full image."""
     return CropBox(0, 0, image_width, image_height)
@@ -62,25 +97,55 @@ def centered_crop_for_ratio(
     return CropBox(x, y, width, height)
 
 
-def _display_rect(
+def fit_size(
+    width: int,
+    height: int,
+    max_width: int,
+    max_height: int,
+) -> Tuple[int, int]:
+    """Return ``width`` x ``height`` scaled down to fit the maximum size.
+
+    The aspect ratio is kept and sizes that already fit are returned as is.
+    """
+    if width <= max_width and height <= max_height:
+        return width, height
+    layout = canvas_layout(width, height, max_width, max_height)
+    return layout.display_width, layout.display_height
+
+
+@lru_cache(maxsize=64)
+def canvas_layout(
     image_width: int,
     image_height: int,
     canvas_width: int,
     canvas_height: int,
-) -> tuple[int, int, int, int]:
-    """Compute how the image is letterboxed inside the canvas."""
-    image_ratio = image_width / image_height
-    canvas_ratio = canvas_width / canvas_height
-    if image_ratio > canvas_ratio:
+) -> CanvasLayout:
+    """Return the :class:`CanvasLayout` for an image shown in a canvas.
+
+    The fit uses integer cross-multiplication only, so no float ratios are
+    formed. Memoized, as the same few image/canvas sizes recur for a whole
+    session.
+    """
+    if image_width * canvas_height > image_height * canvas_width:
         display_width = canvas_width
-        display_height = int(canvas_width / image_ratio)
+        display_height = max(1, image_height * canvas_width // image_width)
     else:
         display_height = canvas_height
-        display_width = int(canvas_height * image_ratio)
+        display_width = max(1, image_width * canvas_height // image_height)
 
     offset_x = (canvas_width - display_width) // 2
     offset_y = (canvas_height - display_height) // 2
-    return display_width, display_height, offset_x, offset_y
+    return CanvasLayout(
+        image_width,
+        image_height,
+        display_width,
+        display_height,
+        offset_x,
+        offset_y,
+        (image_width / display_width, image_height / display_height),
+        (display_width / image_width, display_height / image_height),
+        (offset_x, offset_y, offset_x + display_width, offset_y + display_height),
+    )
 
 
 def crop_box_from_canvas_drag(
@@ -99,45 +164,63 @@ def crop_box_from_canvas_drag(
     The logic mirrors the original method in the Tkinter app but is kept
     independent from any widget APIs.
     """
-    display_width, display_height, offset_x, offset_y = _display_rect(
-        image_width,
-        image_height,
-        canvas_width,
-        canvas_height,
-    )
+    layout = canvas_layout(image_width, image_height, canvas_width, canvas_height)
+    return crop_box_from_layout(layout, x0, y0, x1, y1, aspect_ratio)
+
+
+def crop_box_from_layout(
+    layout: CanvasLayout,
+    x0: int,
+    y0: int,
+    x1: int,
+    y1: int,
+    aspect_ratio: float | None,
+) -> CropBox:
+    """Like :func:`crop_box_from_canvas_drag`, using a precomputed layout."""
+    left, top, right, bottom = layout.bounds
 
     # Clamp drag coordinates into the displayed image area.
-    x0 = max(offset_x, min(x0, offset_x + display_width))
-    y0 = max(offset_y, min(y0, offset_y + display_height))
-    x1 = max(offset_x, min(x1, offset_x + display_width))
-    y1 = max(offset_y, min(y1, offset_y + display_height))
+    x0 = max(left, min(x0, right))
+    y0 = max(top, min(y0, bottom))
+    x1 = max(left, min(x1, right))
+    y1 = max(top, min(y1, bottom))
 
-    scale_x = image_width / display_width
-    scale_y = image_height / display_height
+    scale_x, scale_y = layout.scale_disp_to_img
 
-    x = int((x0 - offset_x) * scale_x)
-    y = int((y0 - offset_y) * scale_y)
+    x = int((x0 - left) * scale_x)
+    y = int((y0 - top) * scale_y)
     width = int((x1 - x0) * scale_x)
     height = int((y1 - y0) * scale_y)
 
     if aspect_ratio:
         width = int(height * aspect_ratio)
 
-    width = max(1, min(width, image_width - x))
-    height = max(1, min(height, image_height - y))
+    width = max(1, min(width, layout.image_width - x))
+    height = max(1, min(height, layout.image_height - y))
 
     return CropBox(x, y, width, height)
 
 
+def parse_frame_rate(rate: str | None) -> float:
+    """Convert an ffprobe rate such as ``"30000/1001"`` to frames per second.
+
+    Returns 0.0 when the rate is missing or malformed.
+    """
+    if not rate:
+        return 0.0
+    num, _, den = rate.partition("/")
+    try:
+        value = float(num) / float(den or 1)
+    except (ValueError, ZeroDivisionError):
+        return 0.0
+    return value
+
+
 def describe_video(
     video_path: Path,
-    metadata: Mapping[str, Any],
+    info: VideoInfo,
 ) -> tuple[str, float]:
     """Return a human-readable info string and duration in seconds."""
-    duration = float(metadata["format"]["duration"])
-    stream = metadata["streams"][0]
-    width = stream.get("width")
-    height = stream.get("height")
-    msg = f"Loaded: {video_path.name}\n{width}x{height} • {duration:.2f}s"
-    return msg, duration
+    msg = f"Loaded: {video_path.name}\n{info.width}x{info.height} • {info.duration:.2f}s"
+    return msg, info.duration
 
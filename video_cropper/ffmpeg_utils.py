@@ -1,23 +1,39 @@
 """Helpers for interacting with ffmpeg and ffprobe."""
 from __future__ import annotations
 
+import functools
 import json
 import shutil
 import subprocess
+import sys
 from pathlib import Path
-from typing import Any, Dict, Tuple
+from typing import Callable, Dict, Literal, Tuple
 
+from .core import VideoInfo, fit_size, parse_frame_rate
 
-def ensure_ffmpeg_available() -> None:
-    """Raise a helpful error when ffmpeg is not on PATH."""
-    if shutil.which("ffmpeg") is None:
+
+@functools.lru_cache(maxsize=1)
+def _ffmpeg_paths() -> Tuple[str, str]:
+    """Return absolute ``(ffmpeg, ffprobe)`` paths, searching PATH only once.
+
+    Failures are not cached, so installing ffmpeg while the app runs works.
+    """
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
         raise EnvironmentError(
             "ffmpeg is required but was not found on PATH. Install ffmpeg and try again."
         )
-    if shutil.which("ffprobe") is None:
+    ffprobe = shutil.which("ffprobe")
+    if ffprobe is None:
         raise EnvironmentError(
             "ffprobe is required but was not found on PATH. Install ffmpeg and try again."
         )
+    return ffmpeg, ffprobe
+
+
+def ensure_ffmpeg_available() -> None:
+    """Raise a helpful error when ffmpeg is not on PATH."""
+    _ffmpeg_paths()
 
 
 def run_command(args: list[str]) -> subprocess.CompletedProcess:
@@ -25,17 +41,23 @@ def run_command(args: list[str]) -> subprocess.CompletedProcess:
     return subprocess.run(args, capture_output=True, text=True, check=False)
 
 
-def probe_video(video_path: Path) -> Dict[str, Any]:
-    """Return basic video metadata using ffprobe."""
-    ensure_ffmpeg_available()
+def probe_video(video_path: Path) -> VideoInfo:
+    """Return basic video metadata using ffprobe.
+
+    Only the first video stream and the handful of fields the app uses are
+    requested, which keeps ffprobe's JSON small.
+    """
+    _, ffprobe = _ffmpeg_paths()
     result = run_command(
         [
-            "ffprobe",
+            ffprobe,
             "-v",
             "error",
+            "-select_streams",
+            "v:0",
             "-show_entries",
-            "format=duration",
-            "-show_streams",
+            "stream=codec_name,width,height,coded_width,coded_height,r_frame_rate,nb_frames"
+            ":format=duration",
             "-print_format",
             "json",
             str(video_path),
@@ -43,27 +65,306 @@ def probe_video(video_path: Path) -> Dict[str, Any]:
     )
     if result.returncode != 0:
         raise RuntimeError(f"Could not probe video: {result.stderr}")
-    return json.loads(result.stdout)
+    data = json.loads(result.stdout)
+    streams = data.get("streams") or []
+    if not streams:
+        raise RuntimeError(f"No video stream found in {video_path.name}")
+    stream = streams[0]
+    return VideoInfo(
+        width=int(stream["width"]),
+        height=int(stream["height"]),
+        duration=float(data["format"]["duration"]),
+        fps=parse_frame_rate(stream.get("r_frame_rate")),
+        codec=stream.get("codec_name"),
+        coded_width=stream.get("coded_width") or None,
+        coded_height=stream.get("coded_height") or None,
+    )
 
 
-def extract_frame(video_path: Path, output_path: Path, timestamp: float = 0.0) -> None:
-    """Extract a single frame at the given timestamp for preview purposes."""
-    ensure_ffmpeg_available()
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    args = [
-        "ffmpeg",
-        "-y",
+def extract_frame(
+    video_path: Path,
+    timestamp: float,
+    width: int,
+    height: int,
+    *,
+    video_filter: str | None = None,
+    keyframe_only: bool = False,
+    max_size: Tuple[int, int] | None = None,
+) -> Tuple[int, int, bytes]:
+    """Extract a single frame as ``(width, height, rgb24 bytes)`` for preview purposes."""
+    ffmpeg, _ = _ffmpeg_paths()
+    args = [ffmpeg]
+    if keyframe_only:
+        # Return the keyframe the input seek lands on instead of decoding
+        # forward to the exact timestamp.
+        args += ["-skip_frame", "nokey", "-noaccurate_seek"]
+    args += [
         "-ss",
         str(timestamp),
         "-i",
         str(video_path),
-        "-vframes",
+        # Only the first video stream is demuxed and decoded.
+        "-map",
+        "0:v:0",
+        "-an",
+        "-sn",
+        "-dn",
+        "-frames:v",
         "1",
-        str(output_path),
     ]
-    result = run_command(args)
-    if result.returncode != 0:
-        raise RuntimeError(f"Could not extract frame: {result.stderr}")
+    filters = [video_filter] if video_filter else []
+    if max_size is not None:
+        # Scale down inside ffmpeg so only a display-sized frame is piped.
+        fitted = fit_size(width, height, *max_size)
+        if fitted != (width, height):
+            width, height = fitted
+            filters.append(f"scale={width}:{height}:flags=lanczos")
+    if filters:
+        args += ["-filter:v", ",".join(filters)]
+    args += [
+        "-f",
+        "rawvideo",
+        "-pix_fmt",
+        "rgb24",
+        "-s",
+        f"{width}x{height}",
+        "pipe:1",
+    ]
+    result = subprocess.run(args, capture_output=True, check=False)
+    expected = width * height * 3
+    if result.returncode != 0 or len(result.stdout) < expected:
+        stderr = result.stderr.decode(errors="replace")
+        raise RuntimeError(f"Could not extract frame: {stderr}")
+    return width, height, result.stdout[:expected]
+
+
+class FrameServer:
+    """Serve rgb24 frames from one long-running ffmpeg process.
+
+    Frames are read sequentially from ffmpeg's stdout, so stepping forward
+    (playback, small scrubs) costs a pipe read rather than a new process.
+    Requests behind the current position or too far ahead respawn ffmpeg
+    with an input-level ``-ss`` seek. Requests past the last frame return
+    the last frame.
+    """
+
+    # Reading ahead up to this many seconds is cheaper than a respawn.
+    max_skip = 1.0
+
+    def __init__(self, video_path: Path, width: int, height: int, fps: float) -> None:
+        self.video_path = video_path
+        self.width = width
+        self.height = height
+        self.frame_interval = 1 / fps if fps > 0 else 1 / 25
+        self._frame_bytes = width * height * 3
+        self._process: subprocess.Popen | None = None
+        # Timestamp of the next frame waiting in the pipe.
+        self._position = 0.0
+        self._last_frame: tuple[float, bytes] | None = None
+        # Last frame of the video, once the end of the stream has been read.
+        self._tail: tuple[float, bytes] | None = None
+        # Set by interrupt(); no new ffmpeg process is started after that.
+        self._interrupted = False
+
+    def get_frame(self, timestamp: float) -> bytes:
+        """Return the frame shown at ``timestamp`` as packed rgb24 bytes."""
+        half_frame = self.frame_interval / 2
+        if self._last_frame and abs(self._last_frame[0] - timestamp) < half_frame:
+            return self._last_frame[1]
+        if self._tail and timestamp >= self._tail[0]:
+            return self._tail[1]
+        if (
+            self._process is None
+            or timestamp < self._position - half_frame
+            or timestamp > self._position + self.max_skip
+        ):
+            self._spawn(timestamp)
+        frame = self._read_until(timestamp)
+        if frame is None and timestamp > 0:
+            # A seek past the last frame yields nothing at all; seek a bit
+            # earlier and read through to the end instead.
+            self._spawn(max(0.0, timestamp - self.max_skip))
+            frame = self._read_until(timestamp)
+        if frame is None:
+            raise RuntimeError(f"Could not extract frame at {timestamp:.2f}s")
+        return frame
+
+    def close(self) -> None:
+        """Stop the ffmpeg process, if running."""
+        if self._process is None:
+            return
+        self._process.kill()
+        self._process.wait()
+        if self._process.stdout:
+            self._process.stdout.close()
+        self._process = None
+        self._last_frame = None
+
+    def interrupt(self) -> None:
+        """Kill ffmpeg from another thread, ending any read in progress for good."""
+        self._interrupted = True
+        process = self._process
+        if process is not None:
+            process.kill()
+
+    def _spawn(self, timestamp: float) -> None:
+        self.close()
+        if self._interrupted:
+            raise RuntimeError("Frame server was closed")
+        ffmpeg, _ = _ffmpeg_paths()
+        args = [
+            ffmpeg,
+            "-ss",
+            str(timestamp),
+            "-i",
+            str(self.video_path),
+            "-map",
+            "0:v:0",
+            "-an",
+            "-sn",
+            "-dn",
+            "-f",
+            "rawvideo",
+            "-pix_fmt",
+            "rgb24",
+            "-s",
+            f"{self.width}x{self.height}",
+            "-vsync",
+            "0",
+            "-loglevel",
+            "error",
+            "pipe:1",
+        ]
+        self._process = subprocess.Popen(
+            args,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            # The windowed build has no console; don't let ffmpeg open one.
+            creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0,
+        )
+        self._position = timestamp
+
+    def _read_until(self, timestamp: float) -> bytes | None:
+        """Read up to the frame shown at ``timestamp``, stopping at the last frame."""
+        half_frame = self.frame_interval / 2
+        # Frame most recently read from the running process, if any.
+        last = self._last_frame
+        while True:
+            frame_time = self._position
+            frame = self._read_frame()
+            if frame is None:
+                if last is None:
+                    return None
+                self._tail = self._last_frame = last
+                return last[1]
+            last = self._last_frame = (frame_time, frame)
+            if frame_time + half_frame >= timestamp:
+                return frame
+
+    def _read_frame(self) -> bytes | None:
+        """Read the next frame, or stop ffmpeg and return ``None`` at the end."""
+        assert self._process is not None and self._process.stdout is not None
+        frame = self._process.stdout.read(self._frame_bytes)
+        if len(frame) < self._frame_bytes:
+            self.close()
+            return None
+        self._position += self.frame_interval
+        return frame
+
+
+# Hardware H.264 encoders in order of preference, with their extra args.
+HW_ENCODERS: Dict[str, list[str]] = {
+    "h264_nvenc": ["-preset", "p4"],
+    "h264_videotoolbox": [],
+    "h264_qsv": [],
+    "h264_amf": [],
+}
+
+
+@functools.lru_cache(maxsize=1)
+def hardware_encoder() -> str | None:
+    """Return the first hardware H.264 encoder that works here, or ``None``.
+
+    Static ffmpeg builds list encoders whose hardware is missing, so each
+    candidate is checked with a tiny test encode. The answer is cached.
+    """
+    ffmpeg, _ = _ffmpeg_paths()
+    listing = run_command([ffmpeg, "-hide_banner", "-encoders"])
+    if listing.returncode != 0:
+        return None
+    names = {fields[1] for fields in map(str.split, listing.stdout.splitlines()) if len(fields) > 1}
+    for name in HW_ENCODERS:
+        if name not in names:
+            continue
+        check = run_command(
+            [
+                ffmpeg,
+                "-hide_banner",
+                "-loglevel",
+                "error",
+                "-f",
+                "lavfi",
+                "-i",
+                "color=size=256x256:duration=0.1",
+                "-c:v",
+                name,
+                # Same args as a real export, so unsupported options fail here.
+                *HW_ENCODERS[name],
+                "-f",
+                "null",
+                "-",
+            ]
+        )
+        if check.returncode == 0:
+            return name
+    return None
+
+
+def _bitstream_crop_args(video_path: Path, crop_box: Tuple[int, int, int, int]) -> list[str] | None:
+    """Return args that crop via H.264/HEVC SPS metadata without re-encoding.
+
+    Returns ``None`` when the source codec or crop offsets don't allow it
+    (4:2:0 chroma needs even offsets).
+    """
+    x, y, width, height = crop_box
+    if any(value % 2 for value in crop_box):
+        return None
+    info = probe_video(video_path)
+    codec = info.codec
+    if codec not in ("h264", "hevc"):
+        return None
+    # Crop offsets replace the stream's own cropping, so they are measured
+    # from the coded size.
+    coded_width = info.coded_width or info.width
+    coded_height = info.coded_height or info.height
+    right = coded_width - x - width
+    bottom = coded_height - y - height
+    if right < 0 or bottom < 0:
+        return None
+    bsf = f"{codec}_metadata=crop_left={x}:crop_right={right}:crop_top={y}:crop_bottom={bottom}"
+    return ["-c:v", "copy", "-bsf:v", bsf]
+
+
+# libx264 settings per export quality. "balanced" matches x264's own
+# defaults; "fast" trades some file size for a much quicker encode.
+X264_QUALITY: Dict[str, list[str]] = {
+    "fast": ["-preset", "veryfast", "-crf", "20", "-tune", "fastdecode"],
+    "balanced": ["-preset", "medium", "-crf", "23"],
+    "archival": ["-preset", "slow", "-crf", "18"],
+}
+
+# Containers that accept -movflags; faststart moves the index to the front
+# so the file can play before it has fully downloaded.
+_MOV_SUFFIXES = (".mp4", ".m4v", ".mov", ".3gp")
+
+# Containers that can hold H.264; other outputs (.webm, .mpg, ...) are left
+# to ffmpeg's default encoder for the container.
+_H264_SUFFIXES = (*_MOV_SUFFIXES, ".mkv", ".ts", ".m2ts", ".mts", ".flv")
+
+# With -loglevel error, anything on the merged stream that is not a progress
+# key is a diagnostic; these are the prefixes ffmpeg starts them with.
+_ERROR_PREFIXES = ("[", "Error", "error", "Invalid", "Unknown", "Could not", "Conversion failed")
 
 
 def crop_video(
@@ -71,18 +372,48 @@ def crop_video(
     output_path: Path,
     crop_box: Tuple[int, int, int, int],
     progress_callback: callable | None = None,
+    *,
+    encoder: str | None = "libx264",
+    bitstream_crop: bool = False,
+    quality: Literal["fast", "balanced", "archival"] = "balanced",
 ) -> None:
-    """Crop the video using ffmpeg with the provided crop box (x, y, width, height)."""
-    ensure_ffmpeg_available()
+    """Crop the video using ffmpeg with the provided crop box (x, y, width, height).
+
+    ``encoder`` names the video encoder; ``"auto"`` opts in to a working
+    hardware H.264 encoder when there is one (falling back to libx264), and
+    ``None`` leaves the choice to ffmpeg, as do ``"auto"`` and ``"libx264"``
+    for containers that can't hold H.264. ``quality`` picks the libx264
+    settings from :data:`X264_QUALITY`; hardware encoders keep their own
+    rate control, which is usually far lower quality. With
+    ``bitstream_crop``, H.264/HEVC sources are cropped by rewriting the
+    stream's crop metadata instead of re-encoding, when the crop allows it.
+    """
+    ffmpeg, _ = _ffmpeg_paths()
     x, y, width, height = crop_box
     output_path.parent.mkdir(parents=True, exist_ok=True)
+    video_args = _bitstream_crop_args(video_path, crop_box) if bitstream_crop else None
+    input_args: list[str] = []
+    if video_args is None:
+        if encoder in ("auto", "libx264") and output_path.suffix.lower() not in _H264_SUFFIXES:
+            encoder = None
+        if encoder == "auto":
+            encoder = hardware_encoder() or "libx264"
+        video_args = ["-filter:v", f"crop={width}:{height}:{x}:{y}"]
+        if encoder == "libx264":
+            video_args += ["-c:v", encoder, *X264_QUALITY[quality], "-threads", "0"]
+        elif encoder:
+            video_args += ["-c:v", encoder, *HW_ENCODERS.get(encoder, [])]
+            if encoder in HW_ENCODERS:
+                input_args = ["-hwaccel", "auto"]
+    if output_path.suffix.lower() in _MOV_SUFFIXES:
+        video_args += ["-movflags", "+faststart"]
     args = [
-        "ffmpeg",
+        ffmpeg,
         "-y",
+        *input_args,
         "-i",
         str(video_path),
-        "-filter:v",
-        f"crop={width}:{height}:{x}:{y}",
+        *video_args,
         "-c:a",
         "copy",
         "-progress",
@@ -93,12 +424,14 @@ def crop_video(
         str(output_path),
     ]
 
+    # Binary, block-buffered reads: -progress emits a dozen key=value lines
+    # per record, so lines are split out of 64 KiB chunks here and at most
+    # one progress message is reported per record.
     process = subprocess.Popen(
         args,
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
-        text=True,
-        bufsize=1,
+        bufsize=65536,
     )
     assert process.stdout is not None
 
@@ -108,24 +441,47 @@ def crop_video(
         secs = seconds % 60
         return f"{hours:02d}:{minutes:02d}:{secs:06.3f}"
 
-    for line in process.stdout:
-        cleaned = line.strip()
-        if not cleaned:
-            continue
-        if cleaned.startswith("out_time_ms="):
+    record_time: str | None = None
+
+    def _on_out_time(value: str) -> None:
+        nonlocal record_time
+        record_time = value
+
+    def _on_progress(value: str) -> None:
+        nonlocal record_time
+        if progress_callback and record_time is not None:
             try:
-                out_time_us = int(cleaned.split("=", 1)[1])
-                timestamp = out_time_us / 1_000_000
-                if progress_callback:
-                    progress_callback(f"Processing timestamp: {_format_timecode(timestamp)}")
+                timestamp = int(record_time) / 1_000_000
+                progress_callback(f"Processing timestamp: {_format_timecode(timestamp)}")
             except ValueError:
-                if progress_callback:
-                    progress_callback(cleaned)
-        elif cleaned.startswith("progress="):
-            if cleaned.split("=", 1)[1] == "end" and progress_callback:
-                progress_callback("ffmpeg processing complete.")
-        elif "error" in cleaned.lower() and progress_callback:
+                progress_callback(f"out_time_ms={record_time}")
+        record_time = None
+        if value == "end" and progress_callback:
+            progress_callback("ffmpeg processing complete.")
+
+    handlers: Dict[str, Callable[[str], None]] = {
+        "out_time_ms": _on_out_time,
+        "progress": _on_progress,
+    }
+
+    def _handle_line(cleaned: str) -> None:
+        key, _, value = cleaned.partition("=")
+        handler = handlers.get(key)
+        if handler is not None:
+            handler(value)
+        elif progress_callback and cleaned.startswith(_ERROR_PREFIXES):
             progress_callback(f"ffmpeg: {cleaned}")
+
+    pending = b""
+    for chunk in iter(lambda: process.stdout.read1(65536), b""):
+        lines = (pending + chunk).split(b"\n")
+        pending = lines.pop()
+        for raw in lines:
+            cleaned = raw.decode("utf-8", "replace").strip()
+            if cleaned:
+                _handle_line(cleaned)
+    if pending.strip():
+        _handle_line(pending.decode("utf-8", "replace").strip())
     process.wait()
     if process.returncode != 0:
         raise RuntimeError("Cropping failed. See logs for details.")